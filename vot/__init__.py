@@ -67,6 +67,7 @@ class GlobalConfiguration(Attributee):
     - ``VOT_MASK_OPTIMIZE_READ``: Enables mask optimization when reading masks.
     - ``VOT_WORKER_POOL_SIZE``: Number of workers to use for parallel processing.
     - ``VOT_PERSISTENT_CACHE``: Enables persistent cache for analysis results in workspace.
+    - ``VOT_PARALLEL_OVERLAPS``: Computes overlaps of region lists in a multi-threaded kernel.
 
     """
 
@@ -76,6 +77,7 @@ class GlobalConfiguration(Attributee):
     mask_optimize_read = Boolean(default=True, description="Enables mask optimization when reading masks.")
     worker_pool_size = Integer(default=1, description="Number of workers to use for parallel processing.")
     persistent_cache = Boolean(default=True, description="Enables persistent cache for analysis results in workspace.")
+    parallel_overlaps = Boolean(default=False, description="Computes overlaps of region lists in a multi-threaded kernel.")
     registry = List(String(), default="", separator=os.pathsep, description="List of directories to search for tracker metadata.")
 
     def __init__(self):
@@ -10,7 +10,20 @@ _TYPE_RECTANGLE = 1
 _TYPE_POLYGON = 2
 _TYPE_MASK = 3
 
-@numba.njit(cache=True)
+# Bit-packed rasters store pixel x of a row in bit x % 64 of word x // 64
+_WORD_ONES = np.uint64(0xFFFFFFFFFFFFFFFF)
+_POPCOUNT_M1 = np.uint64(0x5555555555555555)
+_POPCOUNT_M2 = np.uint64(0x3333333333333333)
+_POPCOUNT_M4 = np.uint64(0x0F0F0F0F0F0F0F0F)
+_POPCOUNT_H = np.uint64(0x0101010101010101)
+# Multiplication with this constant gathers the lowest bits of eight bytes to the highest byte of a word
+_GATHER = np.uint64(0x0102040810204080)
+
+# Fast-math flags for kernels: reciprocal, reassociation and contraction are left out on purpose, since they change
+# the rounding of polygon intersections and break exact overlap values (e.g. one for identical regions).
+_FASTMATH = {"nnan", "ninf", "nsz"}
+
+@numba.njit(cache=True, fastmath=_FASTMATH, boundscheck=False, error_model='numpy')
 def mask_bounds(mask: np.ndarray):
     """ Compute bounds of a binary mask. Bounds are defined as the minimal axis-aligned region containing all positive pixels.
     This is a Numba implementation of the function that is compiled to machine code for faster execution.
@@ -21,25 +34,75 @@ def mask_bounds(mask: np.ndarray):
     Returns:
         coordinates of the top-left and bottom-right corners of the minimal axis-aligned region containing all positive pixels
     """
-    ii32 = np.iinfo(np.int32)
-    top = ii32.max
-    bottom = ii32.min
-    left = ii32.max
-    right = ii32.min
-
-    for i in range(mask.shape[0]):
-        for j in range(mask.shape[1]):
-            if mask[i, j] != 0:
-                top = min(top, i)
-                bottom = max(bottom, i)
-                left = min(left, j)
-                right = max(right, j)
-
-    if top == ii32.max:
+    height, width = mask.shape
+
+    # Reduce the mask to per-row and per-column occupancy in a single pass, the inner
+    # loop has no early exit so that it can be vectorized.
+    rows = np.zeros((height, ), dtype=np.bool_)
+    cols = np.zeros((width, ), dtype=np.bool_)
+
+    for i in range(height):
+        nonzero = False
+        for j in range(width):
+            v = mask[i, j] != 0
+            nonzero |= v
+            cols[j] |= v
+        rows[i] = nonzero
+
+    top = 0
+    while top < height and not rows[top]:
+        top += 1
+
+    if top == height:
         return (0, 0, 0, 0)
 
+    bottom = height - 1
+    while not rows[bottom]:
+        bottom -= 1
+
+    left = 0
+    while not cols[left]:
+        left += 1
+
+    right = width - 1
+    while not cols[right]:
+        right -= 1
+
     return (left, top, right, bottom)
 
+@numba.njit(cache=True)
+def _fill_bits(row: np.ndarray, left: int, right: int):
+    """ Set a run of pixels in a row of a bit-packed mask. This is a Numba implementation of the function that is compiled to machine code for faster execution.
+
+    Args:
+        row: 1-D array of 64-bit words with a row of the mask
+        left: first pixel of the run
+        right: last pixel of the run
+    """
+    first = left >> 6
+    last = right >> 6
+    head = _WORD_ONES << np.uint64(left & 63)
+    tail = _WORD_ONES >> np.uint64(63 - (right & 63))
+
+    if first == last:
+        row[first] |= head & tail
+    else:
+        row[first] |= head
+        row[first + 1:last] = _WORD_ONES
+        row[last] |= tail
+
+@numba.njit(cache=True)
+def _packed_width(width: int):
+    """ Calculate the number of 64-bit words needed to store a row of a bit-packed mask.
+
+    Args:
+        width: width of the mask in pixels
+
+    Returns:
+        number of words in a row
+    """
+    return (width + 63) >> 6
+
 
 @numba.njit(cache=True)
 def rasterize_rectangle(data: np.ndarray, bounds: Tuple[int, int, int, int]):
@@ -62,23 +125,53 @@ def rasterize_rectangle(data: np.ndarray, bounds: Tuple[int, int, int, int]):
 
     left = max(0, data[0, 0] - bounds[0])
     top = max(0, data[1, 0] - bounds[1])
-    right = min(bounds[2], data[0, 0] + data[2, 0] - 1 - bounds[0])
-    bottom = min(bounds[3], data[1, 0] + data[3, 0] - 1 - bounds[1])
+    right = min(bounds[2] - bounds[0], data[0, 0] + data[2, 0] - 1 - bounds[0])
+    bottom = min(bounds[3] - bounds[1], data[1, 0] + data[3, 0] - 1 - bounds[1])
 
     mask[top:bottom+1, left:right+1] = 1
 
     return mask
 
 @numba.njit(cache=True)
-def rasterize_polygon(data: np.ndarray, bounds: Tuple[int, int, int, int]):
-    """ Rasterize a polygon. This is a Numba implementation of the function that is compiled to machine code for faster execution.
+def _rasterize_rectangle_packed(data: np.ndarray, bounds: Tuple[int, int, int, int]):
+    """ Rasterize a rectangle to a bit-packed mask. This is a Numba implementation of the function that is compiled to machine code for faster execution.
+
+    Args:
+        data: 4x1 array with rectangle coordinates (x, y, width, height)
+        bounds: 4-tuple with the bounds of the image (left, top, right, bottom)
+
+    Returns:
+        2-D array of 64-bit words with the rasterized rectangle, an empty (0x0) array if the rectangle does not cover any pixel
+    """
+    width = bounds[2] - bounds[0] + 1
+    height = bounds[3] - bounds[1] + 1
+
+    left = int(max(0, data[0, 0] - bounds[0]))
+    top = int(max(0, data[1, 0] - bounds[1]))
+    right = int(min(width - 1, data[0, 0] + data[2, 0] - 1 - bounds[0]))
+    bottom = int(min(height - 1, data[1, 0] + data[3, 0] - 1 - bounds[1]))
+
+    if left > right or top > bottom:
+        # Rectangle is outside of the bounds, skip allocation of an all-zero raster
+        return np.zeros((0, 0), dtype=np.uint64)
+
+    mask = np.zeros((height, _packed_width(width)), dtype=np.uint64)
+
+    for i in range(top, bottom + 1):
+        _fill_bits(mask[i], left, right)
+
+    return mask
+
+@numba.njit(cache=True, fastmath=_FASTMATH, boundscheck=False, error_model='numpy')
+def _polygon_spans(data: np.ndarray, bounds: Tuple[int, int, int, int]):
+    """ Compute horizontal runs of pixels covered by a polygon using a scan-line fill. This is a Numba implementation of the function that is compiled to machine code for faster execution.
 
     Args:
         data: Nx2 array with polygon coordinates
         bounds: 4-tuple with the bounds of the image (left, top, right, bottom)
 
     Returns:
-        2-D array with the rasterized polygon
+        Nx3 array with the row, the first and the last pixel of each run, relative to the bounds
     """
 
     #int nodes, pixelY, i, j, swap;
@@ -89,46 +182,78 @@ def rasterize_polygon(data: np.ndarray, bounds: Tuple[int, int, int, int]):
     height = bounds[3] - bounds[1] + 1
 
     nodeX = np.zeros((count, ), dtype=np.int64)
-    mask = np.zeros((height, width), dtype=np.uint8)
+    spans = np.empty((max(16, height), 3), dtype=np.int64)
+    n = 0
 
     polygon = np.empty_like(data)
     np.round(data, 0, polygon)
 
-    polygon = polygon - np.array([[bounds[0], bounds[1]]])
+    # Rounded coordinates are integral, converting them once keeps the scan-line tests in integer arithmetic. Integers
+    # are 64-bit since coordinates of a polygon are not limited to the image.
+    px = polygon[:, 0].astype(np.int64)
+    py = polygon[:, 1].astype(np.int64)
+
+    px -= bounds[0]
+    py -= bounds[1]
+
+    # Build the edge table, edge i connects vertex i with the previous vertex. An edge
+    # is active for all rows between its top and bottom vertex (inclusive).
+    edgeTop = np.empty((count, ), dtype=np.int64)
+    edgeBottom = np.empty((count, ), dtype=np.int64)
+    j = count - 1
+    for i in range(count):
+        edgeTop[i] = min(py[i], py[j])
+        edgeBottom[i] = max(py[i], py[j])
+        j = i
+
+    edges = np.argsort(edgeTop)
+    active = np.zeros((count, ), dtype=np.int64)
+    actives = 0
+    pending = 0
 
     #  Loop through the rows of the image.
     for pixelY in range(height):
 
-        #  Build a list of nodes.
+        # Add edges that start in the current row to the active edge table.
+        while pending < count and edgeTop[edges[pending]] <= pixelY:
+            active[actives] = edges[pending]
+            actives = actives + 1
+            pending = pending + 1
+
+        if actives == 0 and pending == count:
+            break
+
+        # Build a list of nodes and remove edges that end above the current row. The loop is branchless, a node is
+        # computed for every edge and the position only advances for edges that remain active.
         nodes = 0
-        j = count - 1
-
-        for i in range(count):
-            if (((polygon[i, 1] <= pixelY) and (polygon[j, 1] > pixelY)) or
-                    ((polygon[j, 1] <= pixelY) and (polygon[i, 1] > pixelY)) or
-                    ((polygon[i, 1] < pixelY) and (polygon[j, 1] >= pixelY)) or
-                    ((polygon[j, 1] < pixelY) and (polygon[i, 1] >= pixelY)) or
-                    ((polygon[i, 1] == polygon[j, 1]) and (polygon[i, 1] == pixelY))):
-                r = (polygon[j, 1] - polygon[i, 1])
-                k = (polygon[j, 0] - polygon[i, 0])
-                if r != 0:
-                    nodeX[nodes] = (polygon[i, 0] + (pixelY - polygon[i, 1]) / r * k)
-                else:
-                    nodeX[nodes] = polygon[i, 0]
-                nodes = nodes + 1
-            j = i
-
-        # Sort the nodes, via a simple “Bubble” sort.
-        i = 0
-        while (i < nodes - 1):
-            if nodeX[i] > nodeX[i + 1]:
+
+        for a in range(actives):
+            i = active[a]
+            j = i - 1 if i > 0 else count - 1
+            r = (py[j] - py[i])
+            k = (px[j] - px[i])
+            # A horizontal edge is only active in its own row, where (pixelY - py[i]) is zero, so dividing by one
+            # instead of zero yields its first vertex. Intersection is computed in floating point and truncated,
+            # exactly as for float coordinates.
+            r = r if r != 0 else 1
+            active[nodes] = i
+            nodeX[nodes] = (px[i] + (pixelY - py[i]) / r * k)
+            nodes += edgeBottom[i] >= pixelY
+
+        actives = nodes
+
+        # Sort the nodes, via an insertion sort that is linear on nearly sorted input,
+        # fall back to NumPy sort for rows with many intersections.
+        if nodes > 32:
+            nodeX[:nodes] = np.sort(nodeX[:nodes])
+        else:
+            for i in range(1, nodes):
                 swap = nodeX[i]
-                nodeX[i] = nodeX[i + 1]
-                nodeX[i + 1] = swap
-                if (i):
-                    i = i - 1
-            else:
-                i = i + 1
+                j = i - 1
+                while j >= 0 and nodeX[j] > swap:
+                    nodeX[j + 1] = nodeX[j]
+                    j = j - 1
+                nodeX[j + 1] = swap
 
         #  Fill the pixels between node pairs.
         i = 0
@@ -146,14 +271,62 @@ def rasterize_polygon(data: np.ndarray, bounds: Tuple[int, int, int, int]):
                     nodeX[i] = 0
                 if nodeX[i + 1] >= width:
                     nodeX[i + 1] = width - 1
-                for j in range(nodeX[i], nodeX[i + 1] + 1):
-                    mask[pixelY, j] = 1
+                if n == spans.shape[0]:
+                    grown = np.empty((n * 2, 3), dtype=np.int64)
+                    grown[:n] = spans
+                    spans = grown
+                spans[n, 0] = pixelY
+                spans[n, 1] = nodeX[i]
+                spans[n, 2] = nodeX[i + 1]
+                n = n + 1
             i += 2
 
-    return mask
+    return spans[:n]
+
+@numba.njit(cache=True, fastmath=_FASTMATH, boundscheck=False, error_model='numpy')
+def rasterize_polygon(data: np.ndarray, bounds: Tuple[int, int, int, int]):
+    """ Rasterize a polygon. This is a Numba implementation of the function that is compiled to machine code for faster execution.
+
+    Args:
+        data: Nx2 array with polygon coordinates
+        bounds: 4-tuple with the bounds of the image (left, top, right, bottom)
+
+    Returns:
+        2-D array with the rasterized polygon
+    """
+    mask = np.zeros((bounds[3] - bounds[1] + 1, bounds[2] - bounds[0] + 1), dtype=np.uint8)
+
+    spans = _polygon_spans(data, bounds)
 
+    # Filling a run with a scalar broadcast is lowered to a memset, unlike the per-pixel loop (array-to-array slice
+    # assignment is not, see copy_mask)
+    for i in range(spans.shape[0]):
+        mask[spans[i, 0], spans[i, 1]:spans[i, 2] + 1] = 1
+
+    return mask
 
 @numba.njit(cache=True)
+def _rasterize_polygon_packed(data: np.ndarray, bounds: Tuple[int, int, int, int]):
+    """ Rasterize a polygon to a bit-packed mask. This is a Numba implementation of the function that is compiled to machine code for faster execution.
+
+    Args:
+        data: Nx2 array with polygon coordinates
+        bounds: 4-tuple with the bounds of the image (left, top, right, bottom)
+
+    Returns:
+        2-D array of 64-bit words with the rasterized polygon
+    """
+    mask = np.zeros((bounds[3] - bounds[1] + 1, _packed_width(bounds[2] - bounds[0] + 1)), dtype=np.uint64)
+
+    spans = _polygon_spans(data, bounds)
+
+    for i in range(spans.shape[0]):
+        _fill_bits(mask[spans[i, 0]], spans[i, 1], spans[i, 2])
+
+    return mask
+
+
+@numba.njit(cache=True, fastmath=_FASTMATH, boundscheck=False, error_model='numpy')
 def copy_mask(mask: np.ndarray, offset: Tuple[int, int], bounds: Tuple[int, int, int, int]):
     """ Copy a mask to a new location. This is a Numba implementation of the function that is compiled to machine code for faster execution.
      
@@ -179,9 +352,71 @@ def copy_mask(mask: np.ndarray, offset: Tuple[int, int], bounds: Tuple[int, int,
 
     copy = np.zeros((bounds[3] - bounds[1] + 1, bounds[2] - bounds[0] + 1), dtype=np.uint8)
 
+    # Copy rows through views so that the inner loop only uses non-negative indices and compiles to a vectorized copy,
+    # Numba implements array-to-array slice assignment with a generic element-wise iterator that is much slower
+    # (unlike a scalar broadcast fill, which is lowered to a memset).
+    for i in range(th):
+        source = mask[i + gy, gx:gx + tw]
+        target = copy[i + oy, ox:ox + tw]
+        for j in range(tw):
+            target[j] = source[j]
+
+    return copy
+
+@numba.njit(cache=True)
+def _copy_mask_packed(mask: np.ndarray, offset: Tuple[int, int], bounds: Tuple[int, int, int, int]):
+    """ Copy a mask to a new location in a bit-packed mask. This is a Numba implementation of the function that is compiled to machine code for faster execution.
+
+    Args:
+        mask: 2-D array with the mask
+        offset: 2-tuple with the offset of the mask
+        bounds: 4-tuple with the bounds of the image (left, top, right, bottom)
+
+    Returns:
+        2-D array of 64-bit words with the copied mask
+    """
+
+    tx = max(offset[0], bounds[0])
+    ty = max(offset[1], bounds[1])
+
+    ox = tx - bounds[0]
+    oy = ty - bounds[1]
+    gx = tx - offset[0]
+    gy = ty - offset[1]
+
+    tw = min(bounds[2] + 1, offset[0] + mask.shape[1]) - tx
+    th = min(bounds[3] + 1, offset[1] + mask.shape[0]) - ty
+
+    words = _packed_width(bounds[2] - bounds[0] + 1)
+    copy = np.zeros((bounds[3] - bounds[1] + 1, words), dtype=np.uint64)
+
+    if tw <= 0 or th <= 0:
+        return copy
+
+    # Rows are first copied to a byte buffer that is aligned with the words of the packed row, the buffer is then
+    # packed eight pixels at a time. Bytes outside of the copied range stay zero for all rows.
+    first = ox >> 6
+    last = (ox + tw - 1) >> 6
+    buffer = np.zeros((words * 64, ), dtype=np.uint8)
+    chunks = buffer.view(np.uint64)
+
     for i in range(th):
+        source = mask[i + gy, gx:gx + tw]
+        target = buffer[ox:ox + tw]
         for j in range(tw):
-            copy[i + oy, j + ox] = mask[i + gy, j + gx]
+            target[j] = source[j]
+        row = copy[i + oy]
+        for w in range(first, last + 1):
+            word = np.uint64(0)
+            for b in range(8):
+                v = chunks[w * 8 + b]
+                # Reduce every byte to its lowest bit, then gather the lowest bits of all eight bytes to a single byte
+                v |= v >> np.uint64(4)
+                v |= v >> np.uint64(2)
+                v |= v >> np.uint64(1)
+                v &= _POPCOUNT_H
+                word |= ((v * _GATHER) >> np.uint64(56)) << np.uint64(b * 8)
+            row[w] = word
 
     return copy
 
@@ -197,7 +432,7 @@ def _bounds_rectangle(a):
     """
     return (int(round(a[0, 0])), int(round(a[1, 0])), int(round(a[0, 0] + a[2, 0] - 1)), int(round(a[1, 0] + a[3, 0] - 1)))
 
-@numba.njit(cache=True)
+@numba.njit(cache=True, fastmath=_FASTMATH, boundscheck=False, error_model='numpy')
 def _bounds_polygon(a):
     """ Calculate the bounds of a polygon. This is a Numba implementation of the function that is compiled to machine code for faster execution.
     
@@ -207,17 +442,10 @@ def _bounds_polygon(a):
     Returns:
         4-tuple with the bounds of the polygon (left, top, right, bottom)
     """
-    fi32 = np.finfo(np.float32)
-    top = fi32.max
-    bottom = fi32.min
-    left = fi32.max
-    right = fi32.min
-
-    for i in range(a.shape[0]):
-        top = min(top, a[i, 1])
-        bottom = max(bottom, a[i, 1])
-        left = min(left, a[i, 0])
-        right = max(right, a[i, 0])
+    left = a[:, 0].min()
+    right = a[:, 0].max()
+    top = a[:, 1].min()
+    bottom = a[:, 1].max()
     return (int(round(left)), int(round(top)), int(round(right)), int(round(bottom)))
 
 @numba.njit(cache=True)
@@ -278,10 +506,206 @@ def _region_raster(a: np.ndarray, bounds: Tuple[int, int, int, int], t: int, o:
     return np.zeros((bounds[3] - bounds[1] + 1, bounds[2] - bounds[0] + 1), dtype=np.uint8)
 
 @numba.njit(cache=True)
-def _calculate_overlap(a: np.ndarray, b: np.ndarray, at: int, bt: int, ao: Optional[Tuple[int, int]] = None,
-        bo: Optional[Tuple[int, int]] = None, bounds: Optional[Tuple[int, int]] = None, ignore: Optional[np.array] = None, it: Optional[int] = None, io: Optional[Tuple[int, int]] = None):
-    """ Calculate the overlap between two regions. This is a Numba implementation of the function that is compiled to machine code for faster execution.
-    
+def _region_raster_packed(a: np.ndarray, bounds: Tuple[int, int, int, int], t: int, o: Optional[Tuple[int, int]] = None):
+    """ Rasterize a region to a bit-packed mask. This is a Numba implementation of the function that is compiled to machine code for faster execution.
+
+    Args:
+        a: 2-D array with the mask
+        bounds: 4-tuple with the bounds of the image (left, top, right, bottom)
+        t: type of the region
+        o: 2-tuple with the offset of the mask
+
+    Returns:
+        2-D array of 64-bit words with the rasterized region, an empty (0x0) array stands for a raster without any pixels
+    """
+
+    if t == _TYPE_RECTANGLE:
+        return _rasterize_rectangle_packed(a, bounds)
+    elif t == _TYPE_POLYGON:
+        return _rasterize_polygon_packed(a, bounds)
+    elif t == _TYPE_MASK:
+        return _copy_mask_packed(a, o, bounds)
+
+    return np.zeros((0, 0), dtype=np.uint64)
+
+@numba.njit(cache=True, fastmath=_FASTMATH, boundscheck=False, error_model='numpy')
+def _mask_area(mask: np.ndarray, offset: Tuple[int, int], bounds: Tuple[int, int, int, int]):
+    """ Count the pixels of a mask within bounds. This is a Numba implementation of the function that is compiled to machine code for faster execution.
+
+    Args:
+        mask: 2-D array with the mask
+        offset: 2-tuple with the offset of the mask
+        bounds: 4-tuple with the bounds of the image (left, top, right, bottom)
+
+    Returns:
+        number of non-zero pixels of the mask within the bounds
+    """
+
+    tx = max(offset[0], bounds[0])
+    ty = max(offset[1], bounds[1])
+
+    gx = tx - offset[0]
+    gy = ty - offset[1]
+
+    tw = min(bounds[2] + 1, offset[0] + mask.shape[1]) - tx
+    th = min(bounds[3] + 1, offset[1] + mask.shape[0]) - ty
+
+    area = 0
+
+    for i in range(th):
+        source = mask[i + gy, gx:gx + tw]
+        for j in range(tw):
+            area += source[j] != 0
+
+    return area
+
+@numba.njit(cache=True)
+def _cached_area(a: np.ndarray, bounds: Tuple[int, int, int, int], t: int, o: Tuple[int, int], c: int):
+    """ Get the number of pixels of a mask within bounds from the pixel count of the whole mask. This is a Numba implementation of the function that is compiled to machine code for faster execution.
+
+    Args:
+        a: 2-D array with the mask
+        bounds: 4-tuple with the bounds of the image (left, top, right, bottom)
+        t: type of the region
+        o: 2-tuple with the offset of the mask
+        c: number of pixels of the whole mask, negative if not known
+
+    Returns:
+        number of pixels of the mask within the bounds, negative if the region is not a mask, the pixel count is not known
+        or the mask is not entirely within the bounds
+    """
+    if t != _TYPE_MASK or c < 0:
+        return -1
+    if o[0] < bounds[0] or o[1] < bounds[1] or o[0] + a.shape[1] - 1 > bounds[2] or o[1] + a.shape[0] - 1 > bounds[3]:
+        return -1
+    return c
+
+@numba.njit(cache=True)
+def _region_raster_window(a: np.ndarray, bounds: Tuple[int, int, int, int], window: Tuple[int, int, int, int], t: int, o: Optional[Tuple[int, int]] = None, area: int = -1):
+    """ Rasterize a part of a region to a bit-packed mask and count the pixels of the whole region. This is a Numba implementation of the function that is compiled to machine code for faster execution.
+
+    Args:
+        a: 2-D array with the mask
+        bounds: 4-tuple with the bounds of the image (left, top, right, bottom)
+        window: 4-tuple with the rasterized part of the bounds (left, top, right, bottom)
+        t: type of the region
+        o: 2-tuple with the offset of the mask
+        area: number of pixels of the region within the bounds if known, negative otherwise
+
+    Returns:
+        2-D array of 64-bit words with the region rasterized within the window and the number of pixels of the region within the bounds
+    """
+
+    if t == _TYPE_RECTANGLE:
+        return _rasterize_rectangle_packed(a, window), _rectangle_area(_bounds_rectangle(a), bounds)
+    elif t == _TYPE_POLYGON:
+        # Runs are computed within the bounds and clipped to the window, the scan-line fill truncates intersections
+        # relative to the left border, so a polygon rasterized within the window directly could differ by a pixel.
+        spans = _polygon_spans(a, bounds)
+        dx = window[0] - bounds[0]
+        dy = window[1] - bounds[1]
+        width = window[2] - window[0]
+        height = window[3] - window[1]
+        mask = np.zeros((height + 1, _packed_width(width + 1)), dtype=np.uint64)
+        area = 0
+        row = -1
+        covered = -1
+        for i in range(spans.shape[0]):
+            # Runs are ordered by rows and starts, but neighboring runs in a row can share a pixel
+            if spans[i, 0] != row:
+                row = spans[i, 0]
+                covered = -1
+            area += max(0, spans[i, 2] - max(spans[i, 1], covered + 1) + 1)
+            covered = max(covered, spans[i, 2])
+            y = spans[i, 0] - dy
+            left = max(0, spans[i, 1] - dx)
+            right = min(width, spans[i, 2] - dx)
+            if y >= 0 and y <= height and left <= right:
+                _fill_bits(mask[y], left, right)
+        return mask, area
+    elif t == _TYPE_MASK:
+        return _copy_mask_packed(a, o, window), area if area >= 0 else _mask_area(a, o, bounds)
+
+    return np.zeros((0, 0), dtype=np.uint64), 0
+
+@numba.njit(cache=True)
+def _popcount(x: np.uint64):
+    """ Count the number of set bits in a 64-bit word using SWAR arithmetic, LLVM lowers this pattern to a single
+    POPCNT instruction where available. This is a Numba implementation of the function that is compiled to machine code for faster execution.
+
+    Args:
+        x: 64-bit word
+
+    Returns:
+        number of set bits in the word
+    """
+    x = x - ((x >> np.uint64(1)) & _POPCOUNT_M1)
+    x = (x & _POPCOUNT_M2) + ((x >> np.uint64(2)) & _POPCOUNT_M2)
+    x = (x + (x >> np.uint64(4))) & _POPCOUNT_M4
+    return (x * _POPCOUNT_H) >> np.uint64(56)
+
+@numba.njit(cache=True)
+def _overlap_count_packed(m1: np.ndarray, m2: np.ndarray, m3: Optional[np.ndarray] = None):
+    """ Count the intersection and union of two regions rasterized to bit-packed masks. This is a Numba implementation of the function that is compiled to machine code for faster execution.
+
+    Args:
+        m1: 2-D array of 64-bit words with the first rasterized region
+        m2: 2-D array of 64-bit words with the second rasterized region
+        m3: 2-D array of 64-bit words with the rasterized region to ignore
+
+    Returns:
+        2-tuple with the number of pixels in the intersection and union of the two regions
+    """
+
+    a1 = m1.ravel()
+    a2 = m2.ravel()
+
+    intersection = 0
+    union = 0
+
+    if m1.size == 0 or m2.size == 0:
+        # One of the rasters is empty (0x0), the intersection is empty and the union is the other raster
+        a = a2 if m1.size == 0 else a1
+        if m3 is None:
+            for i in range(a.size):
+                union += _popcount(a[i])
+        else:
+            a3 = m3.ravel()
+            for i in range(a.size):
+                union += _popcount(a[i] & ~a3[i])
+    elif m3 is None:
+        for i in range(a1.size):
+            intersection += _popcount(a1[i] & a2[i])
+            union += _popcount(a1[i] | a2[i])
+    else:
+        a3 = m3.ravel()
+        for i in range(a1.size):
+            keep = ~a3[i]
+            intersection += _popcount(a1[i] & a2[i] & keep)
+            union += _popcount((a1[i] | a2[i]) & keep)
+
+    return intersection, union
+
+@numba.njit(cache=True)
+def _rectangle_area(r: Tuple[int, int, int, int], bounds: Tuple[int, int, int, int]):
+    """ Calculate the number of pixels of a rectangle within bounds. This is a Numba implementation of the function that is compiled to machine code for faster execution.
+
+    Args:
+        r: 4-tuple with the rectangle (left, top, right, bottom)
+        bounds: 4-tuple with the bounds of the image (left, top, right, bottom)
+
+    Returns:
+        number of pixels of the rectangle within the bounds
+    """
+    width = min(r[2], bounds[2]) - max(r[0], bounds[0]) + 1
+    height = min(r[3], bounds[3]) - max(r[1], bounds[1]) + 1
+    return max(0, width) * max(0, height)
+
+@numba.njit(cache=True)
+def _overlap_bounds(a: np.ndarray, b: np.ndarray, at: int, bt: int, ao: Optional[Tuple[int, int]] = None,
+        bo: Optional[Tuple[int, int]] = None, bounds: Optional[Tuple[int, int]] = None):
+    """ Calculate the bounds within which two regions have to be rasterized to compute their overlap. This is a Numba implementation of the function that is compiled to machine code for faster execution.
+
     Args:
         a: 2-D array with the mask of the first region
         b: 2-D array with the mask of the second region
@@ -289,13 +713,12 @@ def _calculate_overlap(a: np.ndarray, b: np.ndarray, at: int, bt: int, ao: Optio
         bt: type of the second region
         ao: 2-tuple with the offset of the first mask
         bo: 2-tuple with the offset of the second mask
-        bounds: 2-tuple with the bounds of the image (left, top, right, bottom)
-        ignore: 2-D array with the mask of the region to ignore
-        it: type of the region to ignore
-        io: 2-tuple with the offset of the mask to ignore
-    
+        bounds: 2-tuple with the bounds of the image (width, height)
+
     Returns:
-        float with the overlap between the two regions. Note that overlap is one by definition if both regions are empty.
+        3-tuple with the overlap, if it is determined without rasterization, or a negative value otherwise,
+        4-tuple with the rasterization bounds (left, top, right, bottom) and 4-tuple with the intersection of
+        the bounds of both regions within the rasterization bounds
     """
 
     bounds1 = _region_bounds(a, at, ao)
@@ -305,7 +728,11 @@ def _calculate_overlap(a: np.ndarray, b: np.ndarray, at: int, bt: int, ao: Optio
 
     if union[0] >= union[2] or union[1] >= union[3]:
         # Two empty regons are considered to be identical
-        return float(1)
+        return float(1), union, union
+
+    if bounds1[2] < bounds2[0] or bounds2[2] < bounds1[0] or bounds1[3] < bounds2[1] or bounds2[3] < bounds1[1]:
+        # Regions do not intersect, no need to rasterize them.
+        return float(0), union, union
 
     if not bounds is None:
         raster_bounds = (max(0, union[0]), max(0, union[1]), min(bounds[0] - 1, union[2]), min(bounds[1] - 1, union[3]))
@@ -314,41 +741,146 @@ def _calculate_overlap(a: np.ndarray, b: np.ndarray, at: int, bt: int, ao: Optio
 
     if raster_bounds[0] >= raster_bounds[2] or raster_bounds[1] >= raster_bounds[3]:
         # Regions are not identical, but are outside rasterization bounds.
-        return float(0)
+        return float(0), raster_bounds, raster_bounds
 
-    m1 = _region_raster(a, raster_bounds, at, ao)
-    m2 = _region_raster(b, raster_bounds, bt, bo)
+    intersection = (max(bounds1[0], bounds2[0], raster_bounds[0]), max(bounds1[1], bounds2[1], raster_bounds[1]),
+        min(bounds1[2], bounds2[2], raster_bounds[2]), min(bounds1[3], bounds2[3], raster_bounds[3]))
 
-    a1 = m1.ravel()
-    a2 = m2.ravel()
+    return float(-1), raster_bounds, intersection
 
-    intersection = 0
-    union_ = 0
+@numba.njit(cache=True, fastmath=_FASTMATH, boundscheck=False, error_model='numpy')
+def _calculate_overlap(a: np.ndarray, b: np.ndarray, at: int, bt: int, ao: Optional[Tuple[int, int]] = None,
+        bo: Optional[Tuple[int, int]] = None, bounds: Optional[Tuple[int, int]] = None, ignore: Optional[np.array] = None, it: Optional[int] = None, io: Optional[Tuple[int, int]] = None,
+        ac: int = -1, bc: int = -1):
+    """ Calculate the overlap between two regions. This is a Numba implementation of the function that is compiled to machine code for faster execution.
+    
+    Args:
+        a: 2-D array with the mask of the first region
+        b: 2-D array with the mask of the second region
+        at: type of the first region
+        bt: type of the second region
+        ao: 2-tuple with the offset of the first mask
+        bo: 2-tuple with the offset of the second mask
+        bounds: 2-tuple with the bounds of the image (left, top, right, bottom)
+        ignore: 2-D array with the mask of the region to ignore
+        it: type of the region to ignore
+        io: 2-tuple with the offset of the mask to ignore
+        ac: number of pixels of the first mask, negative if not known
+        bc: number of pixels of the second mask, negative if not known
+    
+    Returns:
+        float with the overlap between the two regions. Note that overlap is one by definition if both regions are empty.
+    """
+
+    overlap, raster_bounds, window = _overlap_bounds(a, b, at, bt, ao, bo, bounds)
+
+    if overlap >= 0:
+        return overlap
+
+    if at == _TYPE_RECTANGLE and bt == _TYPE_RECTANGLE and (ignore is None or it == _TYPE_EMPTY):
+        # Overlap of two rectangles can be computed analytically, without rasterization
+        bounds1 = _bounds_rectangle(a)
+        bounds2 = _bounds_rectangle(b)
+        intersection = _rectangle_area((max(bounds1[0], bounds2[0]), max(bounds1[1], bounds2[1]),
+            min(bounds1[2], bounds2[2]), min(bounds1[3], bounds2[3])), raster_bounds)
+        union_ = _rectangle_area(bounds1, raster_bounds) + _rectangle_area(bounds2, raster_bounds) - intersection
+        return float(intersection) / float(union_) if union_ > 0 else float(0)
 
+    if window[0] > window[2] or window[1] > window[3]:
+        # Regions only intersect outside of rasterization bounds
+        return float(0)
+
+    # Rasterizing only the intersection of region bounds requires counting the pixels of both regions separately.
+    # Unless the pixel count of a mask is known, this is an additional pass over the mask, which only pays off if the
+    # intersection is small compared to the bounds.
+    area1 = _cached_area(a, raster_bounds, at, ao, ac)
+    area2 = _cached_area(b, raster_bounds, bt, bo, bc)
+    counts_known = (at != _TYPE_MASK or area1 >= 0) and (bt != _TYPE_MASK or area2 >= 0)
+    window_area = (window[2] - window[0] + 1) * (window[3] - window[1] + 1)
+    raster_area = (raster_bounds[2] - raster_bounds[0] + 1) * (raster_bounds[3] - raster_bounds[1] + 1)
+    small_window = window_area * 2 < raster_area
+    windowed = counts_known or small_window
+
+    # Regions are rasterized to bit-packed masks, eight times smaller than byte masks, so that all rasters of a pair
+    # of large regions fit into cache and are counted a word at a time.
     if not ignore is None and it != _TYPE_EMPTY:
-        m3 = _region_raster(ignore, raster_bounds, it, io)
-        a3 = m3.ravel()
-        for i in range(a1.size):
-            if a3[i] == 0: # Non-negative value means that we ignore the pixel
-                if a1[i] != 0 or a2[i] != 0:
-                    union_ += 1
-                    if a1[i] != 0 and a2[i] != 0:
-                        intersection += 1
+        # Ignored pixels are removed from both regions, the union has to be counted within the whole bounds
+        m1 = _region_raster_packed(a, raster_bounds, at, ao)
+        m2 = _region_raster_packed(b, raster_bounds, bt, bo)
+        m3 = _region_raster_packed(ignore, raster_bounds, it, io)
+        if m3.size == 0:
+            intersection, union_ = _overlap_count_packed(m1, m2)
+        else:
+            intersection, union_ = _overlap_count_packed(m1, m2, m3)
+    elif windowed:
+        # Only the intersection of region bounds is rasterized, the union is derived from the areas of both regions
+        m1, area1 = _region_raster_window(a, raster_bounds, window, at, ao, area1)
+        m2, area2 = _region_raster_window(b, raster_bounds, window, bt, bo, area2)
+        intersection, _ = _overlap_count_packed(m1, m2)
+        union_ = area1 + area2 - intersection
     else:
-        for i in range(a1.size):
-            if a1[i] != 0 or a2[i] != 0:
-                union_ += 1
-                if a1[i] != 0 and a2[i] != 0:
-                    intersection += 1
+        m1 = _region_raster_packed(a, raster_bounds, at, ao)
+        m2 = _region_raster_packed(b, raster_bounds, bt, bo)
+        intersection, union_ = _overlap_count_packed(m1, m2)
 
     return float(intersection) / float(union_) if union_ > 0 else float(0)
 
+@numba.njit(cache=True, parallel=True)
+def _calculate_overlaps(a: List[np.ndarray], b: List[np.ndarray], at: np.ndarray, bt: np.ndarray, ao: np.ndarray, bo: np.ndarray, ac: np.ndarray, bc: np.ndarray,
+        bounds: Optional[Tuple[int, int]] = None, ignore: Optional[List[np.ndarray]] = None, it: Optional[np.ndarray] = None, io: Optional[np.ndarray] = None):
+    """ Calculate the overlap between pairs of regions in parallel. This is a Numba implementation of the function that is compiled to machine code for faster execution.
+
+    Args:
+        a: list of 2-D arrays with the first regions, all of the same type
+        b: list of 2-D arrays with the second regions, all of the same type
+        at: array with types of the first regions
+        bt: array with types of the second regions
+        ao: Nx2 array with offsets of the first regions
+        bo: Nx2 array with offsets of the second regions
+        ac: array with pixel counts of the first regions, negative if not known
+        bc: array with pixel counts of the second regions, negative if not known
+        bounds: 2-tuple with the bounds of the image (width, height)
+        ignore: list of 2-D arrays with the regions to ignore, all of the same type
+        it: array with types of the regions to ignore
+        io: Nx2 array with offsets of the regions to ignore
+
+    Returns:
+        array with the overlap between every pair of regions
+    """
+
+    overlaps = np.zeros((len(a), ), dtype=np.float64)
+
+    for k in numba.prange(len(a)):
+        # Parallel loop index is unsigned, typed lists are indexed with signed integers
+        i = np.int64(k)
+        if ignore is None:
+            overlaps[i] = _calculate_overlap(a[i], b[i], at[i], bt[i], (ao[i, 0], ao[i, 1]), (bo[i, 0], bo[i, 1]), bounds,
+                ac=ac[i], bc=bc[i])
+        else:
+            overlaps[i] = _calculate_overlap(a[i], b[i], at[i], bt[i], (ao[i, 0], ao[i, 1]), (bo[i, 0], bo[i, 1]), bounds,
+                ignore[i], it[i], (io[i, 0], io[i, 1]))
+
+    return overlaps
+
 from vot.region import Region, RegionException
 from vot.region.shapes import Shape, Rectangle, Polygon, Mask
 
 Bounds = Tuple[int, int]
 
 def _infer_meta(reg: Region):
+    """ Extract data, offset and type of a region as used by the raster kernels. The result is cached on shapes,
+    shapes are treated as immutable, every transformation creates a new object.
+
+    Args:
+        reg: region
+
+    Returns:
+        3-tuple with the region data, the offset and the type of the region
+    """
+    meta = getattr(reg, "_raster_meta", None)
+    if meta is not None:
+        return meta
+
     if isinstance(reg, Rectangle):
         data1 = np.round(reg._data)
         offset1 = (0, 0)
@@ -362,11 +894,50 @@ def _infer_meta(reg: Region):
         offset1 = reg.offset
         type1 = _TYPE_MASK
     else:
-        data1 = np.zeros((1, 1))
-        offset1 = (0, 0)
-        type1 = _TYPE_EMPTY
+        # Other regions (e.g. special regions or missing ones) are empty, nothing is cached for them
+        # Data has the same type as data of rectangles and polygons, so that they are batched together
+        return np.zeros((1, 1), dtype=np.float32), (0, 0), _TYPE_EMPTY
+
+    meta = (data1, offset1, type1)
+    reg._raster_meta = meta
+    return meta
+
+def _infer_count(reg: Region):
+    """ Count the pixels of a mask region. The result is cached on the mask, masks are treated as immutable.
+    Areas of other regions are computed by the raster kernels, since they depend on rasterization.
 
-    return data1, offset1, type1
+    Args:
+        reg: region
+
+    Returns:
+        number of pixels of a mask region, -1 for other regions
+    """
+    if not isinstance(reg, Mask):
+        return -1
+
+    count = getattr(reg, "_pixel_count", None)
+    if count is not None:
+        return count
+
+    count = int(np.count_nonzero(reg.mask))
+    reg._pixel_count = count
+    return count
+
+def _batch_meta(metas: List[tuple]):
+    """ Pack region metadata, as returned by _infer_meta, to arguments of _calculate_overlaps.
+
+    Args:
+        metas: list of region metadata tuples, data of all regions has to be of the same type
+
+    Returns:
+        typed list of region data, array of region types and array of region offsets
+    """
+    data = numba.typed.List()
+    for meta in metas:
+        data.append(np.ascontiguousarray(meta[0]))
+    types = np.array([meta[2] for meta in metas], dtype=np.int64)
+    offsets = np.array([meta[1] for meta in metas], dtype=np.int64).reshape((-1, 2))
+    return data, types, offsets
 
 def calculate_overlap(reg1: Shape, reg2: Shape, bounds: Optional[Bounds] = None, ignore: Optional[Shape] = None):
     """ Calculate the overlap between two regions. The function first rasterizes both regions to 2-D binary masks and calculates overlap between them
@@ -389,9 +960,92 @@ def calculate_overlap(reg1: Shape, reg2: Shape, bounds: Optional[Bounds] = None,
         ignore_data, ignore_offset, ignore_type = _infer_meta(ignore)
         return _calculate_overlap(data1, data2, type1, type2, offset1, offset2, bounds, ignore_data, ignore_type, ignore_offset)
 
-    return _calculate_overlap(data1, data2, type1, type2, offset1, offset2, bounds)
+    return _calculate_overlap(data1, data2, type1, type2, offset1, offset2, bounds, ac=_infer_count(reg1), bc=_infer_count(reg2))
+
+def _calculate_overlaps_cuda(metas1: List[tuple], metas2: List[tuple], metas3: Optional[List[tuple]], bounds: Optional[Bounds] = None):
+    """ Calculate the overlap between pairs of regions, overlaps that involve masks are computed on a CUDA device.
+    Rectangles and polygons paired with a mask are rasterized on the host, all masks are then transferred to the device
+    in a single buffer. Pairs without masks are computed on the host.
+
+    Args:
+        metas1: list of metadata of the first regions, as returned by _infer_meta
+        metas2: list of metadata of the second regions
+        metas3: list of metadata of the regions to ignore
+        bounds: 2-tuple with the bounds of the image (width, height)
+
+    Returns:
+        list of floats with the overlap between the two regions
+
+    Raises:
+        RegionException: if CUDA is not available
+    """
+    from numba import cuda
+
+    if not cuda.is_available():
+        raise RegionException("CUDA is not available")
+
+    from vot.region.raster_cuda import overlap_kernel, THREADS
 
-def calculate_overlaps(first: List[Region], second: List[Region], bounds: Optional[Bounds] = None, ignore: Optional[List[Region]] = None):
+    overlaps = [0.0] * len(metas1)
+
+    pairs = []
+    regions = []
+    rasters = []
+    start = 0
+
+    for i in range(len(metas1)):
+        data1, offset1, type1 = metas1[i]
+        data2, offset2, type2 = metas2[i]
+
+        if type1 != _TYPE_MASK and type2 != _TYPE_MASK:
+            if metas3 is None:
+                overlaps[i] = _calculate_overlap(data1, data2, type1, type2, offset1, offset2, bounds)
+            else:
+                overlaps[i] = _calculate_overlap(data1, data2, type1, type2, offset1, offset2, bounds, metas3[i][0], metas3[i][2], metas3[i][1])
+            continue
+
+        overlap, raster_bounds, _ = _overlap_bounds(data1, data2, type1, type2, offset1, offset2, bounds)
+
+        if overlap >= 0:
+            overlaps[i] = overlap
+            continue
+
+        pair = []
+        for meta in (metas1[i], metas2[i], metas3[i] if not metas3 is None else None):
+            if meta is None or meta[2] == _TYPE_EMPTY:
+                # Empty region, all pixels are outside of it
+                pair.append((0, 0, 0, 0, 0))
+                continue
+            if meta[2] == _TYPE_MASK:
+                raster, offset = np.ascontiguousarray(meta[0]), meta[1]
+            else:
+                # Rasterized within the same bounds as on the host, so that the overlap is identical
+                raster, offset = _region_raster(meta[0], raster_bounds, meta[2], meta[1]), raster_bounds[0:2]
+            pair.append((start, raster.shape[0], raster.shape[1], offset[0], offset[1]))
+            rasters.append(raster.ravel())
+            start += raster.size
+
+        pairs.append((i, raster_bounds))
+        regions.append(pair)
+
+    if not pairs:
+        return overlaps
+
+    data = cuda.to_device(np.concatenate(rasters) if rasters else np.zeros((1, ), dtype=np.uint8))
+    regions = cuda.to_device(np.array(regions, dtype=np.int64))
+    raster_bounds = cuda.to_device(np.array([pair[1] for pair in pairs], dtype=np.int64))
+    counts = cuda.to_device(np.zeros((len(pairs), 2), dtype=np.int64))
+
+    overlap_kernel[len(pairs), THREADS](data, regions, raster_bounds, counts)
+
+    counts = counts.copy_to_host()
+
+    for (i, _), (intersection, union) in zip(pairs, counts):
+        overlaps[i] = float(intersection) / float(union) if union > 0 else float(0)
+
+    return overlaps
+
+def calculate_overlaps(first: List[Region], second: List[Region], bounds: Optional[Bounds] = None, ignore: Optional[List[Region]] = None, backend: str = "cpu"):
     """ Calculate the overlap between two lists of regions. The function first rasterizes both regions to 2-D binary masks and calculates overlap between them
 
     Args:
@@ -399,12 +1053,14 @@ def calculate_overlaps(first: List[Region], second: List[Region], bounds: Option
         second: second list of regions
         bounds: 2-tuple with the bounds of the image (width, height)
         ignore: list of regions to ignore when calculating overlap, usually a list of masks
+        backend: either "cpu" or "cuda", the latter computes overlaps of masks on a CUDA device. The CPU backend computes
+            overlaps in a parallel kernel if the ``parallel_overlaps`` option of the global configuration is enabled.
 
     Returns:
         list of floats with the overlap between the two regions. Note that overlap is one by definition if both regions are empty.
 
     Raises:
-        RegionException: if the lists are not of the same size
+        RegionException: if the lists are not of the same size or the backend is not supported
     """
     if not len(first) == len(second):
         raise RegionException("List not of the same size {} != {}".format(len(first), len(second)))
@@ -412,5 +1068,49 @@ def calculate_overlaps(first: List[Region], second: List[Region], bounds: Option
     if not ignore is None:
         if not len(first) == len(ignore):
             raise RegionException("List not of the same size {} != {}".format(len(first), len(ignore)))
-        return [calculate_overlap(pairs[0], pairs[1], bounds=bounds, ignore=ignore[i]) for i, pairs in enumerate(zip(first, second))]
-    return [calculate_overlap(pairs[0], pairs[1], bounds=bounds) for i, pairs in enumerate(zip(first, second))]
+
+    if not backend in ("cpu", "cuda"):
+        raise RegionException("Unknown overlap backend {}".format(backend))
+
+    metas1 = [_infer_meta(region) for region in first]
+    metas2 = [_infer_meta(region) for region in second]
+    metas3 = [_infer_meta(region) for region in ignore] if not ignore is None else None
+
+    if backend == "cuda":
+        return _calculate_overlaps_cuda(metas1, metas2, metas3, bounds)
+
+    from vot import config
+
+    if not config.parallel_overlaps:
+        if metas3 is None:
+            return [_calculate_overlap(a[0], b[0], a[2], b[2], a[1], b[1], bounds, ac=_infer_count(r1), bc=_infer_count(r2))
+                for a, b, r1, r2 in zip(metas1, metas2, first, second)]
+        return [_calculate_overlap(a[0], b[0], a[2], b[2], a[1], b[1], bounds, c[0], c[2], c[1]) for a, b, c in zip(metas1, metas2, metas3)]
+
+    # Workers of a process pool share the cores, every worker only uses its share of threads
+    numba.set_num_threads(max(1, numba.config.NUMBA_NUM_THREADS // max(1, config.worker_pool_size)))
+
+    # Typed lists have to be homogeneous, pairs are therefore processed in groups with the same data types
+    groups = {}
+    for i in range(len(first)):
+        key = (metas1[i][0].dtype, metas2[i][0].dtype, metas3[i][0].dtype if not metas3 is None else None)
+        groups.setdefault(key, []).append(i)
+
+    overlaps = [0.0] * len(first)
+
+    for indices in groups.values():
+        a, at, ao = _batch_meta([metas1[i] for i in indices])
+        b, bt, bo = _batch_meta([metas2[i] for i in indices])
+        if not metas3 is None:
+            # Pixel counts are not used when pixels are ignored
+            ac = bc = np.full((len(indices), ), -1, dtype=np.int64)
+            c, ct, co = _batch_meta([metas3[i] for i in indices])
+            result = _calculate_overlaps(a, b, at, bt, ao, bo, ac, bc, bounds, c, ct, co)
+        else:
+            ac = np.array([_infer_count(first[i]) for i in indices], dtype=np.int64)
+            bc = np.array([_infer_count(second[i]) for i in indices], dtype=np.int64)
+            result = _calculate_overlaps(a, b, at, bt, ao, bo, ac, bc, bounds)
+        for i, overlap in zip(indices, result):
+            overlaps[i] = float(overlap)
+
+    return overlaps
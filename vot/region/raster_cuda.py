@@ -0,0 +1,79 @@
+""" CUDA kernels for computing overlaps of regions. The module is only imported when the CUDA backend is used, see
+calculate_overlaps in the raster module."""
+
+from numba import cuda, int64
+
+# Number of threads in a block of the overlap kernel
+THREADS = 256
+
+@cuda.jit(device=True)
+def _pixel(data, regions, pair, k, x, y):
+    """ Get a pixel of a mask stored in a flat buffer, pixels outside of the mask are zero.
+
+    Args:
+        data: 1-D array with all masks
+        regions: Nx3x5 array with the start, height, width and offset (x, y) of every mask of a pair
+        pair: index of the pair
+        k: index of the mask within the pair
+        x: horizontal coordinate of the pixel
+        y: vertical coordinate of the pixel
+
+    Returns:
+        1 if the pixel is set, 0 otherwise
+    """
+    x = x - regions[pair, k, 3]
+    y = y - regions[pair, k, 4]
+    if x < 0 or y < 0 or x >= regions[pair, k, 2] or y >= regions[pair, k, 1]:
+        return 0
+    return 1 if data[regions[pair, k, 0] + y * regions[pair, k, 2] + x] != 0 else 0
+
+@cuda.jit
+def overlap_kernel(data, regions, bounds, counts):
+    """ Count the intersection and union of pairs of masks. Every block processes one pair, pixels within the
+    rasterization bounds are distributed among the threads of the block, their counts are summed in shared memory
+    and added to the result by the first thread. The kernel has to be launched with blocks of THREADS threads.
+
+    Args:
+        data: 1-D array with all masks
+        regions: Nx3x5 array with the start, height, width and offset (x, y) of every mask of a pair, the third mask is ignored
+        bounds: Nx4 array with the rasterization bounds (left, top, right, bottom) of every pair
+        counts: Nx2 array of zeros, receives the number of pixels in the intersection and union of every pair
+    """
+    pair = cuda.blockIdx.x
+    left = bounds[pair, 0]
+    top = bounds[pair, 1]
+    width = bounds[pair, 2] - left + 1
+    size = width * (bounds[pair, 3] - top + 1)
+
+    intersection = 0
+    union = 0
+
+    for p in range(cuda.threadIdx.x, size, cuda.blockDim.x):
+        x = left + p % width
+        y = top + p // width
+        # Non-zero value means that we ignore the pixel
+        if _pixel(data, regions, pair, 2, x, y) != 0:
+            continue
+        a = _pixel(data, regions, pair, 0, x, y)
+        b = _pixel(data, regions, pair, 1, x, y)
+        intersection += a & b
+        union += a | b
+
+    # Tree reduction of the counts of all threads in the block, a single atomic update per block remains
+    partial = cuda.shared.array((THREADS, 2), dtype=int64)
+    thread = cuda.threadIdx.x
+    partial[thread, 0] = intersection
+    partial[thread, 1] = union
+    cuda.syncthreads()
+
+    step = THREADS // 2
+    while step > 0:
+        if thread < step:
+            partial[thread, 0] += partial[thread + step, 0]
+            partial[thread, 1] += partial[thread + step, 1]
+        cuda.syncthreads()
+        step //= 2
+
+    if thread == 0:
+        cuda.atomic.add(counts, (pair, 0), partial[0, 0])
+        cuda.atomic.add(counts, (pair, 1), partial[0, 1])
@@ -13,7 +13,8 @@ from vot.region import Region, ConversionException, RegionType, RegionException
 from vot.utilities.draw import DrawHandle
 
 class Shape(Region, ABC):
-    """ Base class for all shape regions. """
+    """ Base class for all shape regions. Shapes should be treated as immutable, all transformations return new objects,
+    so data derived from a shape (e.g. its raster metadata) can be cached on the object. """
 
     @abstractmethod
     def draw(self, handle: DrawHandle) -> None:
@@ -7,6 +7,42 @@ import numpy as np
 
 from vot.region.raster import rasterize_polygon, rasterize_rectangle, copy_mask, calculate_overlap
 
+def _random_regions(rng, n):
+    """Generate a list of random regions of all types, including special regions."""
+    from vot.region import Rectangle, Polygon, Mask, Special
+
+    regions = []
+    for _ in range(n):
+        kind = rng.integers(0, 4)
+        if kind == 0:
+            regions.append(Rectangle(*rng.uniform(-10, 40, 2), *rng.uniform(0, 30, 2)))
+        elif kind == 1:
+            regions.append(Polygon([tuple(p) for p in rng.uniform(-10, 50, (int(rng.integers(3, 8)), 2))]))
+        elif kind == 2:
+            mask = (rng.random(tuple(rng.integers(1, 20, 2))) < 0.7).astype(np.uint8)
+            regions.append(Mask(mask, offset=tuple(int(v) for v in rng.integers(-5, 30, 2))))
+        else:
+            regions.append(Special(0))
+    return regions
+
+def _compare_backends():
+    """Compare the CUDA backend of calculate_overlaps with the CPU backend, raises an assertion error on mismatch."""
+    from vot.region.raster import calculate_overlaps
+
+    rng = np.random.default_rng(0)
+    first, second, ignore = _random_regions(rng, 16), _random_regions(rng, 16), _random_regions(rng, 16)
+
+    for bounds in (None, (40, 30)):
+        for ignored in (None, ignore):
+            expected = calculate_overlaps(first, second, bounds, ignored)
+            actual = calculate_overlaps(first, second, bounds, ignored, backend="cuda")
+            np.testing.assert_array_equal(actual, expected)
+
+def _cuda_available():
+    """Check if CUDA is available, which is also the case for the CUDA simulator (NUMBA_ENABLE_CUDASIM=1)."""
+    from numba import cuda
+    return cuda.is_available()
+
 class TestRasterMethods(unittest.TestCase):
     """Tests for the raster module."""
 
@@ -19,6 +55,11 @@ class TestRasterMethods(unittest.TestCase):
         """Tests if the rectangle rasterization works correctly."""
         np.testing.assert_array_equal(rasterize_rectangle(np.array([[0], [0], [100], [100]], dtype=np.float32), (0, 0, 99, 99)), np.ones((100, 100), dtype=np.uint8))
 
+    def test_rasterize_rectangle_bounds(self):
+        """Tests if the rectangle rasterization works correctly for bounds with negative coordinates."""
+        np.testing.assert_array_equal(rasterize_rectangle(np.array([[-5], [0], [11], [1]], dtype=np.float32), (-10, 0, 5, 0)),
+            np.array([[0] * 5 + [1] * 11], dtype=np.uint8))
+
     def test_copy_mask(self):
         """Tests if the mask copy works correctly."""
         mask = np.ones((100, 100), dtype=np.uint8)
@@ -34,6 +75,85 @@ class TestRasterMethods(unittest.TestCase):
         r1 = Rectangle(0, 0, 0, 0)        
         self.assertEqual(calculate_overlap(r1, r1), 1)
 
+    def test_calculate_overlap_raster(self):
+        """Tests if the overlap calculation matches the overlap of rasterized regions."""
+        from vot.region import Rectangle, Polygon, Mask
+
+        r1 = Rectangle(-3, 2, 90, 50)
+        r2 = Polygon([[10, -5], [120, 30], [60, 80]])
+        r3 = Mask(np.ones((20, 70), dtype=np.uint8), offset=(30, 10))
+        r4 = Mask(np.ones((40, 30), dtype=np.uint8), offset=(50, 5))
+
+        bounds = (-5, -5, 120, 80)
+        for a, b in [(r1, r2), (r2, r3), (r1, r3), (r3, r4)]:
+            m1 = a.rasterize(bounds)
+            m2 = b.rasterize(bounds)
+            self.assertAlmostEqual(calculate_overlap(a, b), np.sum(m1 & m2) / np.sum(m1 | m2))
+
+    def test_calculate_overlaps_backend(self):
+        """Tests if an unknown overlap backend is rejected."""
+        from vot.region import Rectangle, RegionException
+        from vot.region.raster import calculate_overlaps
+
+        with self.assertRaises(RegionException):
+            calculate_overlaps([Rectangle(0, 0, 10, 10)], [Rectangle(0, 0, 10, 10)], backend="unknown")
+
+    def test_calculate_overlaps(self):
+        """Tests if overlaps of lists of regions match overlaps of individual pairs."""
+        from vot.region.raster import calculate_overlaps
+
+        rng = np.random.default_rng(1)
+        first, second, ignore = _random_regions(rng, 40), _random_regions(rng, 40), _random_regions(rng, 40)
+
+        for bounds in (None, (40, 30)):
+            self.assertEqual(calculate_overlaps(first, second, bounds),
+                [calculate_overlap(a, b, bounds) for a, b in zip(first, second)])
+            self.assertEqual(calculate_overlaps(first, second, bounds, ignore),
+                [calculate_overlap(a, b, bounds, ignore=i) for a, b, i in zip(first, second, ignore)])
+
+    def test_calculate_overlaps_parallel(self):
+        """Tests if overlaps computed by the parallel kernel match overlaps of individual pairs."""
+        from vot import config
+        from vot.region import Mask
+        from vot.region.raster import calculate_overlaps
+
+        rng = np.random.default_rng(2)
+        # Shapes and special regions share a data type, with masks as ignored regions only two kernels are compiled
+        shapes = [r for r in _random_regions(rng, 80) if not isinstance(r, Mask)]
+        masks = [r for r in _random_regions(rng, 80) if isinstance(r, Mask)]
+        n = min(len(shapes) // 2, len(masks))
+        first, second, ignore = shapes[:n], shapes[n:2 * n], masks[:n]
+
+        config.parallel_overlaps = True
+        try:
+            self.assertEqual(calculate_overlaps(first, second, (40, 30)),
+                [calculate_overlap(a, b, (40, 30)) for a, b in zip(first, second)])
+            self.assertEqual(calculate_overlaps(first, second, (40, 30), ignore),
+                [calculate_overlap(a, b, (40, 30), ignore=i) for a, b, i in zip(first, second, ignore)])
+        finally:
+            config.parallel_overlaps = False
+
+    @unittest.skipUnless(_cuda_available(), "CUDA is not available, set NUMBA_ENABLE_CUDASIM=1 to use the simulator")
+    def test_calculate_overlaps_cuda(self):
+        """Tests if the CUDA backend matches the CPU backend."""
+        _compare_backends()
+
+    def test_calculate_overlaps_empty_ignore(self):
+        """Tests if special and missing regions in the ignore list are treated as empty."""
+        from vot.region import Rectangle, Special
+        from vot.region.raster import calculate_overlaps
+
+        regions = [Rectangle(0, 0, 10, 10), Rectangle(5, 5, 10, 10)]
+        self.assertEqual(calculate_overlaps(regions, regions, None, [None, None]), [1.0, 1.0])
+        self.assertEqual(calculate_overlaps(regions, regions, None, [Special(0), None]), [1.0, 1.0])
+
+    def test_calculate_overlaps_empty(self):
+        """Tests if special and missing regions in the compared lists are treated as empty."""
+        from vot.region import Rectangle, Special
+        from vot.region.raster import calculate_overlaps
+
+        self.assertEqual(calculate_overlaps([None, Special(0), Rectangle(0, 0, 10, 10)], [None, Rectangle(0, 0, 10, 10), Special(0)]), [1.0, 0.0, 0.0])
+
     def test_ignore_mask(self):
         """Tests if the mask ignore works correctly."""
         from vot.region import Mask